@@ -25,7 +25,6 @@ from ._wrapper import (
     transform_dgrid_winds_to_agrid_winds
 )
 from ._restart import get_restart_names, open_restart
-from . import examples
 
 from .thermodynamics import set_state_mass_conserving
 
@@ -61,3 +60,20 @@ def get_diagnostic_metadata_by_name(
 __version__ = "0.6.0"
 
 __all__ = list(key for key in locals().keys() if not key.startswith("_"))
+__all__.append("examples")
+
+
+def __getattr__(name):
+    # examples optionally imports sklearn_json, which is slow to import when
+    # installed, so only load it on first access
+    if name == "examples":
+        # not "from . import examples", which checks hasattr and recurses here;
+        # the import system binds the submodule onto this package
+        import importlib
+
+        return importlib.import_module(".examples", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"examples"})
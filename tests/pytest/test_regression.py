@@ -1,5 +1,7 @@
+import concurrent.futures
 import copy
 import datetime
+import functools
 import glob
 import os
 from os.path import join
@@ -11,6 +13,7 @@ import xarray
 import subprocess
 import typing
 import hashlib
+import mmap
 
 import re
 import prescribed_ssts
@@ -25,6 +28,8 @@ STDOUT_FILENAME = "stdout.log"
 STDERR_FILENAME = "stderr.log"
 MD5SUM_FILENAME = "md5.txt"
 SERIALIZE_MD5SUM_FILENAME = "md5_serialize.txt"
+MD5SUM_LINE_PATTERN = re.compile(r"([0-9a-fA-F]{32}) [ *](.+)")
+MMAP_THRESHOLD = 64 * 1024
 GOOGLE_APP_CREDS = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", None)
 
 USE_LOCAL_ARCHIVE = True
@@ -59,12 +64,18 @@ def image_runner(request):
     return request.config.getoption("--image_runner")
 
 
-def get_config(filename):
+@functools.lru_cache(maxsize=None)
+def _load_config(filename):
     config_filename = os.path.join(CONFIG_DIR, filename)
     with open(config_filename, "r") as f:
         return fv3config.load(f)
 
 
+def get_config(filename):
+    # copy so tests cannot modify the cached config
+    return copy.deepcopy(_load_config(filename))
+
+
 def get_run_dir(model_image_tag, config):
     run_name = config["experiment_name"]
     return os.path.join(OUTPUT_DIR, model_image_tag, run_name)
@@ -301,15 +312,19 @@ def test_zhao_carr_surface_precipitation_matches_total_water_source(
 
 
 def checksum_file(path: str) -> str:
-    sum = hashlib.md5()
-    BUFFER_SIZE = 1024 * 1024
     with open(path, "rb") as f:
-        while True:
-            buf = f.read(BUFFER_SIZE)
-            if not buf:
-                break
-            sum.update(buf)
-    return sum.hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest()
+        elif os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            return _mmap_md5(f)
+        else:
+            return hashlib.md5(f.read()).hexdigest()
+
+
+def _mmap_md5(f) -> str:
+    """checksum an open file without copying its contents into Python bytes"""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return hashlib.md5(buf).hexdigest()
 
 
 def _checksum_restart_files(rundir: str) -> typing.Dict[str, str]:
@@ -338,7 +353,7 @@ def test_checksum_emulation(emulation_run, system_regtest):
 
 def check_rundir_md5sum(run_dir, md5sum_filename):
     ensure_reference_exists(md5sum_filename)
-    subprocess.check_call(["md5sum", "-c", md5sum_filename], cwd=run_dir)
+    check_md5sum(run_dir, md5sum_filename)
 
 
 def ensure_reference_exists(filename):
@@ -406,8 +421,113 @@ def run_model_sarus(rundir, model_image, n_processes):
     subprocess.check_call(call, env=env, cwd=rundir)
 
 
+def read_md5sum_file(md5sum_filename) -> typing.Dict[str, str]:
+    """read the output of `md5sum` into a mapping from path to checksum"""
+    checksums = {}
+    with open(md5sum_filename, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            # md5sum separates the path with "  " in text mode and " *" in binary mode
+            match = MD5SUM_LINE_PATTERN.fullmatch(line)
+            if match is None:
+                raise AssertionError(
+                    f"improperly formatted checksum line {line_number} "
+                    f"in {md5sum_filename}: {line!r}"
+                )
+            checksum, path = match.groups()
+            checksums[path] = checksum.lower()
+    if len(checksums) == 0:
+        raise AssertionError(
+            f"no properly formatted checksum lines found in {md5sum_filename}"
+        )
+    return checksums
+
+
 def check_md5sum(run_dir, md5sum_filename):
-    subprocess.check_call(["md5sum", "-c", md5sum_filename], cwd=run_dir)
+    """equivalent to `md5sum -c md5sum_filename` run within run_dir"""
+    expected = read_md5sum_file(md5sum_filename)
+    paths = [os.path.join(run_dir, path) for path in expected]
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        actual = dict(zip(expected, pool.map(_checksum_or_none, paths)))
+    failed = sorted(path for path in expected if actual[path] != expected[path])
+    if len(failed) > 0:
+        raise AssertionError(
+            f"md5sum check against {md5sum_filename} failed for: " + ", ".join(failed)
+        )
+
+
+def _checksum_or_none(path: str) -> typing.Optional[str]:
+    if not os.path.isfile(path):
+        return None
+    return checksum_file(path)
+
+
+@pytest.fixture(params=["file_digest", "fallback"])
+def checksum_implementation(request, monkeypatch):
+    if request.param == "file_digest":
+        if not hasattr(hashlib, "file_digest"):
+            pytest.skip("hashlib.file_digest requires Python 3.11")
+    else:
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    return request.param
+
+
+@pytest.mark.parametrize("size", [0, 5, MMAP_THRESHOLD + 1])
+def test_checksum_file(tmpdir, checksum_implementation, size):
+    path = tmpdir.join("data.nc")
+    path.write_binary(os.urandom(size))
+    output = subprocess.check_output(["md5sum", str(path)])
+    assert checksum_file(str(path)) == output.decode().split()[0]
+
+
+def _write_md5sum_reference(run_dir, binary=False):
+    run_dir.join("a.nc").write("hello")
+    run_dir.join("b.nc").write("world")
+    flags = ["-b"] if binary else []
+    output = subprocess.check_output(
+        ["md5sum"] + flags + ["a.nc", "b.nc"], cwd=str(run_dir)
+    )
+    reference = run_dir.join(MD5SUM_FILENAME)
+    reference.write_binary(output)
+    return str(reference)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_check_md5sum(tmpdir, checksum_implementation, binary):
+    md5sum_filename = _write_md5sum_reference(tmpdir, binary=binary)
+    check_md5sum(str(tmpdir), md5sum_filename)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_check_md5sum_modified_file(tmpdir, checksum_implementation, binary):
+    md5sum_filename = _write_md5sum_reference(tmpdir, binary=binary)
+    tmpdir.join("b.nc").write("changed")
+    with pytest.raises(AssertionError, match="b.nc"):
+        check_md5sum(str(tmpdir), md5sum_filename)
+
+
+def test_check_md5sum_deleted_file(tmpdir):
+    md5sum_filename = _write_md5sum_reference(tmpdir)
+    tmpdir.join("a.nc").remove()
+    with pytest.raises(AssertionError, match="a.nc"):
+        check_md5sum(str(tmpdir), md5sum_filename)
+
+
+def test_check_md5sum_empty_reference(tmpdir):
+    reference = tmpdir.join(MD5SUM_FILENAME)
+    reference.write("")
+    with pytest.raises(AssertionError, match="no properly formatted"):
+        check_md5sum(str(tmpdir), str(reference))
+
+
+def test_check_md5sum_malformed_reference(tmpdir):
+    md5sum_filename = _write_md5sum_reference(tmpdir)
+    with open(md5sum_filename, "a") as f:
+        f.write("MD5 (c.nc) = 5d41402abc4b2a76b9719d911017c592\n")
+    with pytest.raises(AssertionError, match="line 3"):
+        check_md5sum(str(tmpdir), md5sum_filename)
 
 
 def write_run_directory(config, dirname):